@@ -0,0 +1,48 @@
+"""
+Optional Numba kernels for long RRi series.
+
+Numba is not a required dependency of hrv. It is only imported the first time
+a kernel is requested, so importing hrv does not pay Numba's import and
+compilation cost. Compiled kernels are cached on disk, so later sessions skip
+compilation. When Numba is not installed the loaders return None and callers
+fall back to their NumPy implementation.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+__all__ = ['load_cumulative_time']
+
+
+def _cumulative_time(rri):
+    # Kahan compensated summation: on very long recordings the plain
+    # cumulative sum drifts by the accumulated rounding error. Must not be
+    # compiled with fastmath, which would optimize the compensation away
+    n = rri.shape[0]
+    time = np.empty(n)
+    acc = 0.0
+    comp = 0.0
+    for i in range(n):
+        y = rri[i] - comp
+        t = acc + y
+        comp = (t - acc) - y
+        acc = t
+        time[i] = acc / 1000.0
+
+    first = time[0]
+    for i in range(n):
+        time[i] -= first
+
+    return time
+
+
+@lru_cache(maxsize=None)
+def load_cumulative_time():
+    """Return the compiled time array kernel, or None without Numba"""
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover
+        return None
+
+    return njit(cache=True)(_cumulative_time)
@@ -25,13 +25,15 @@ except ImportError:
 
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
 
+from ._numba_kernels import load_cumulative_time
 from .utils import _ellipsedraw
 
 __all__ = ['RRi', 'RRiDetrended']
 
 
-class RRi:
+class RRi(NDArrayOperatorsMixin):
     """An RRi series class.
 
        The RRi class provides magic methods that make it instance behave like
@@ -56,6 +58,11 @@ class RRi:
             time -= time[0]  # to start at zero
 
         Time is represented in seconds
+
+        RRi series are immutable: the arrays returned by `values`, `rri` and
+        `time` are read-only and may be shared with other RRi instances
+        derived from this one (slices, arithmetic results, etc). Use
+        `np.array(rri)` or `rri.values.copy()` to get a writable array.
     """
 
     def __init__(self, rri, time=None, *args, **kwargs):
@@ -64,7 +71,7 @@ class RRi:
             self.__detrended = False
             self.__interpolated = False
         else:
-            self.__rri = np.array(rri)
+            self.__rri = np.array(rri, dtype=np.float64)
             self.__detrended = kwargs.pop("detrended")
             self.__interpolated = kwargs.pop("interpolated", False)
 
@@ -73,12 +80,49 @@ class RRi:
         else:
             self.__time = _validate_time(self.__rri, time)
 
+        _read_only(self.__rri)
+        _read_only(self.__time)
+
+    @classmethod
+    def _from_validated(cls, rri, time, detrended=False, interpolated=False):
+        """
+        Create an RRi series from values and time information that are
+        already validated, i.e. taken from another RRi instance, skipping
+        `_validate_rri` and `_validate_time`.
+        """
+        obj = cls.__new__(cls)
+        obj.__rri = _read_only(_rri_asarray(rri))
+        obj.__time = _read_only(_rri_asarray(time))
+        obj.__detrended = detrended
+        obj.__interpolated = interpolated
+        return obj
+
+    def _derive(self, rri, time):
+        # New series cut from this one: same class and the same
+        # detrended/interpolated flags
+        return type(self)._from_validated(
+            rri, time, detrended=self.__detrended, interpolated=self.__interpolated
+        )
+
+    def copy(self):
+        """Return a copy of the RRi series with its own values and time"""
+        return self._derive(self.__rri.copy(), self.__time.copy())
+
     def __len__(self):
         return len(self.__rri)
 
     def __getitem__(self, position):
+        """
+        Return the RRi value at an integer position or a new RRi series for
+        a slice or a numpy array of indexes.
+
+        A contiguous slice (step 1) returns a view: the new series shares the
+        (read-only) values and time buffers of this one instead of copying
+        them. Stepped slices and numpy arrays of indexes copy the selected
+        values, since RRi buffers are always C-contiguous.
+        """
         if isinstance(position, (slice, np.ndarray)):
-            return RRi(self.__rri[position], self.time[position])
+            return self._derive(self.__rri[position], self.__time[position])
         else:
             return self.__rri[position]
 
@@ -112,7 +156,7 @@ class RRi:
         Return a dictionary containing descriptive statistics from the RRi
         series.
         """
-        table = _prepare_table(RRi(self.rri))
+        table = _prepare_table(self)
         rri_descr = RRiDescription(table)
         for row in table[1:]:
             rri_descr[row[0]]["rri"] = row[1]
@@ -156,12 +200,29 @@ class RRi:
             )
         )
 
-    def to_hr(self):
+    def to_hr(self, copy=True):
         """
         Return a numpy array containing the heart rate calculated with
         the RRi series
+
+        Parameters
+        ----------
+        copy : boolean, default True
+            If false, the heart rate array cached in the instance is returned
+            without copying. This array is read-only
         """
-        return 60 / (self.rri / 1000.0)
+        return self._hr.copy() if copy else self._hr
+
+    @property
+    def _hr(self):
+        # RRi values are read-only and never rebound after construction, so
+        # the heart rate is computed once and shared by to_hr, describe and
+        # hist
+        try:
+            return self.__hr
+        except AttributeError:
+            self.__hr = _read_only(60 / (self.__rri / 1000.0))
+            return self.__hr
 
     def time_range(self, start, end):
         """
@@ -176,7 +237,7 @@ class RRi:
             end of the new RRi series
         """
         interval = np.logical_and(self.time >= start, self.time <= end)
-        return RRi(self.rri[interval], time=self.time[interval])
+        return self._derive(self.rri[interval], self.time[interval])
 
     def reset_time(self, inplace=False):
         """
@@ -187,10 +248,12 @@ class RRi:
         inplace : boolean, default False
             If true, time information of the current RRi series will be reset
         """
+        # time arrays may be shared between instances, so never modify
+        # them in place
         if inplace:
-            self.__time -= self.time[0]
+            self.__time = _read_only(self.__time - self.__time[0])
         else:
-            return RRi(self.rri, time=self.time - self.time[0])
+            return self._derive(self.rri, self.time - self.time[0])
 
     def plot(self, ax=None, *args, **kwargs):
         """
@@ -221,7 +284,7 @@ class RRi:
         """
         fig, ax = plt.subplots(1, 1)
         if hr:
-            ax.hist(self.to_hr(), *args, **kwargs)
+            ax.hist(self._hr, *args, **kwargs)
             ax.set(xlabel="HR (bpm)", ylabel="Frequency")
         else:
             ax.hist(self.rri, *args, **kwargs)
@@ -326,6 +389,12 @@ class RRi:
         keep_last : boolean, optional
             If set to True the last segment is returned even if smaller than
             `seg_size`, defaults to False
+
+        Returns
+        -------
+        segments : list of RRi
+            Each segment is a slice of this series, i.e. it shares the
+            read-only values and time buffers instead of copying them
         """
         rri_duration = self.time[-1]
         if overlap > seg_size:
@@ -333,63 +402,82 @@ class RRi:
         elif seg_size > rri_duration:
             raise Exception("`seg_size` is longer than RRi duration.")
 
-        begin = 0
-        end = seg_size
         step = seg_size - overlap
         n_splits = int((rri_duration - seg_size) / step) + 1
-        segments = []
-        for i in range(n_splits):
-            OP = np.less if i + 1 != n_splits else np.less_equal
-            mask = np.logical_and(self.time >= begin, OP(self.time, end))
-            segments.append(RRi(self.rri[mask], time=self.time[mask]))
-            begin += step
-            end += step
+
+        # Segment boundaries accumulated one step at a time (n_splits + 1
+        # begins, the last one for `keep_last`). Time is sorted, so a binary
+        # search finds all indexes at once. Segments include their begin and
+        # exclude their end, except for the last one.
+        steps = np.full(n_splits + 1, step, dtype=np.float64)
+        steps[0] = 0
+        begins = np.cumsum(steps)
+        steps[0] = seg_size
+        ends = np.cumsum(steps[:-1])
+
+        starts = np.searchsorted(self.time, begins[:-1], side="left")
+        stops = np.searchsorted(self.time, ends, side="left")
+        stops[-1] = np.searchsorted(self.time, ends[-1], side="right")
+
+        segments = [self[start:stop] for start, stop in zip(starts, stops)]
 
         last = segments[-1]
         if keep_last and last.time[-1] < rri_duration:
-            mask = self.time > begin
-            segments.append(RRi(self.rri[mask], time=self.time[mask]))
+            start = np.searchsorted(self.time, begins[-1], side="right")
+            segments.append(self[start:])
 
         return segments
 
     def __repr__(self):
-        return "RRi %s" % np.array_repr(self.rri)
-
-    def __mul__(self, val):
-        return RRi(self.rri * val, self.time)
-
-    def __add__(self, val):
-        return RRi(self.rri + val, self.time)
-
-    def __sub__(self, val):
-        return RRi(self.rri - val, self.time)
-
-    def __truediv__(self, val):
-        return RRi(self.rri / val, self.time)
-
-    def __pow__(self, val):
-        return RRi(self.rri ** val, self.time)
-
-    def __abs__(self):
-        return RRi(np.abs(self.rri), self.time)
-
-    def __eq__(self, val):
-        return self.rri == val
-
-    def __ne__(self, val):
-        return self.rri != val
-
-    def __gt__(self, val):
-        return self.rri > val
-
-    def __ge__(self, val):
-        return self.rri >= val
-
-    def __lt__(self, val):
-        return self.rri < val
-
-    def __le__(self, val):
-        return self.rri <= val
+        # array2string elides long series by formatting only the edge items
+        # and, unlike array_repr, does not append shape/dtype information
+        values = np.array2string(self.rri, separator=", ", prefix="array(")
+        return "RRi array(%s)" % values
+
+    def __array__(self, dtype=None, copy=None):
+        # Lets NumPy functions (np.median, np.asarray, ...) use the
+        # underlying values without iterating over the series
+        if copy:
+            return np.array(self.__rri, dtype=dtype, copy=True)
+        return np.asarray(self.__rri, dtype=dtype)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # Operators are provided by NDArrayOperatorsMixin and all end up
+        # here, so each one is a single ufunc call on the ndarray
+        # RRi series are immutable, they can not be used as output buffer
+        if any(isinstance(val, RRi) for val in kwargs.get("out", ())):
+            return NotImplemented
+
+        inputs = tuple(_unwrap(val) for val in inputs)
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        # Results written into a caller's out= buffer are returned as is, so
+        # `ndarray += rri` keeps the ndarray
+        if (
+            "out" in kwargs
+            or method != "__call__"
+            or not isinstance(result, np.ndarray)
+            or result.dtype == np.bool_
+            or result.shape != self.__rri.shape
+        ):
+            return result
+
+        # Time information is unchanged and a strictly positive result is a
+        # valid RRi series, so only results that may have left the valid range
+        # (e.g. rri - 1000 or rri * -1) go through the full validation, which
+        # then raises
+        if result.size and result.min() > 0:
+            return RRi._from_validated(result, self.__time)
+        return RRi(result, self.__time)
+
+    def _inplace_unsupported(self, val):
+        # Makes `rri += val` fall back to `rri = rri + val`
+        return NotImplemented
+
+    __iadd__ = __isub__ = __imul__ = __itruediv__ = __ifloordiv__ = (
+        _inplace_unsupported
+    )
+    __imod__ = __ipow__ = __imatmul__ = _inplace_unsupported
+    __ilshift__ = __irshift__ = __iand__ = __ixor__ = __ior__ = _inplace_unsupported
 
 
 class RRiDetrended(RRi):
@@ -442,36 +530,59 @@ class RRiDescription(MutableMapping):
         return descr
 
 
+def _unwrap(val):
+    # Operate on the underlying ndarray when the operand is an RRi series
+    return val.values if isinstance(val, RRi) else val
+
+
 def _prepare_table(rri):
-    def _amplitude(values):
-        return values.max() - values.min()
+    def _describe(values):
+        # min/max are shared with amplitude and var with std, so every
+        # statistic costs at most one pass over the values
+        min_, max_ = values.min(), values.max()
+        var = values.var()
+        return {
+            "min": min_,
+            "max": max_,
+            "mean": values.mean(),
+            "var": var,
+            "std": np.sqrt(var),
+            "median": np.median(values),
+            "amplitude": max_ - min_,
+        }
 
     header = ["", "rri", "hr"]
-    fields = ["min", "max", "mean", "var", "std"]
-    hr = rri.to_hr()
-
-    table = []
-    for field in fields:
-        rri_var = rri.__getattribute__(field)()
-        hr_var = hr.__getattribute__(field)()
-        table.append([field, rri_var, hr_var])
+    fields = ["min", "max", "mean", "var", "std", "median", "amplitude"]
+    rri_stats = _describe(rri.values)
+    hr_stats = _describe(rri._hr)
 
-    table.append(["median", rri.median(), np.median(hr)])
-    table.append(["amplitude", rri.amplitude(), _amplitude(hr)])
+    table = [[field, rri_stats[field], hr_stats[field]] for field in fields]
 
     return [header] + table
 
 
+def _rri_asarray(values):
+    # No copy nor scan when values is already a C-contiguous float64 array
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _read_only(values):
+    # Buffers are shared between RRi instances, so none of them may write
+    values.setflags(write=False)
+    return values
+
+
 def _validate_rri(rri):
     # TODO: let the RRi be in seconds if the user wants to
     rri = np.array(rri, dtype=np.float64)
 
-    if any(rri <= 0):
+    # A single reduction instead of a Python-level `any` over the array
+    if rri.size and rri.min() <= 0:
         raise ValueError("rri series can only have positive values")
 
     # Use RRi series median value to check if it is in seconds or miliseconds
     if np.median(rri) < 10:
-        rri *= 1000.0
+        np.multiply(rri, 1000.0, out=rri)
 
     return rri
 
@@ -481,18 +592,30 @@ def _validate_time(rri, time):
     if len(rri) != len(time):
         raise ValueError("rri and time series must have the same length")
 
-    if any(time[1:] == 0):
+    if (time[1:] == 0).any():
         raise ValueError("time series cannot have 0 values after first position")
 
-    if not all(np.diff(time) > 0):
+    if not (np.diff(time) > 0).all():
         raise ValueError("time series must be monotonically increasing")
 
-    if any(time < 0):
+    if time.size and time.min() < 0:
         raise ValueError("time series cannot have negative values")
 
     return time
 
 
+# Below this length the Numba kernel is not worth its dispatch overhead
+_NUMBA_MIN_SIZE = 8192
+
+
 def _create_time_array(rri):
-    time = np.cumsum(rri) / 1000.0
-    return time - time[0]
+    if len(rri) > _NUMBA_MIN_SIZE:
+        cumulative_time = load_cumulative_time()
+        if cumulative_time is not None:
+            return cumulative_time(np.ascontiguousarray(rri, dtype=np.float64))
+
+    # cumsum into a single buffer and finish in place to avoid temporaries
+    time = np.cumsum(rri, dtype=np.float64)
+    time /= 1000.0
+    time -= time[0]
+    return time
@@ -1,7 +1,11 @@
 import os
+from functools import lru_cache
 
 from hrv.io import read_from_text, read_from_hrm
 
+_HERE = os.path.dirname(__file__)
+_HANDLERS = {"txt": read_from_text, "hrm": read_from_hrm}
+
 
 def load_sample_data(filename):
     """
@@ -18,12 +22,15 @@ def load_sample_data(filename):
     -------
         rri = load_sample_data('rest_rri.txt')
     """
-    extension = os.path.splitext(filename)[1]
-    handler = {".txt": read_from_text, ".hrm": read_from_hrm}
+    # RRi series are read-only, so the cached instance is safe to share
+    return _read_sample_data(filename)
+
 
-    here = os.path.dirname(__file__)
-    complete_path = os.path.join(here, filename)
-    return handler[extension](complete_path)
+@lru_cache(maxsize=32)
+def _read_sample_data(filename):
+    # Sample files ship with the package and never change at runtime
+    extension = filename.rpartition(".")[2]
+    return _HANDLERS[extension](os.path.join(_HERE, filename))
 
 
 def load_rest_rri():
@@ -49,3 +49,11 @@ class TestLoadSampleData(TestCase):
         self.assertIsInstance(sample_rri, RRi)
         np.testing.assert_almost_equal(sample_rri[:3], [904.0, 913.0, 937.0])
         np.testing.assert_almost_equal(sample_rri[-3:], [704.0, 805.0, 808.0])
+
+    def test_load_sample_data_is_cached(self):
+        sample_rri = load_sample_data("rest_rri.txt")
+        another_sample_rri = load_sample_data("rest_rri.txt")
+
+        self.assertIs(sample_rri, another_sample_rri)
+        with self.assertRaises(ValueError):
+            sample_rri.values[0] = 0.0
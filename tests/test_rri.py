@@ -3,6 +3,7 @@ try:
     from collections.abc import MutableMapping
 except ImportError:
     from collections import MutableMapping
+import math
 from unittest import mock
 
 import matplotlib
@@ -53,6 +54,28 @@ class TestRRiClassArguments:
         expected -= expected[0]
         np.testing.assert_array_equal(rri_time, expected)
 
+    def test_create_time_array_long_series(self):
+        long_rri = np.tile(FAKE_RRI, 3000)
+
+        rri_time = _create_time_array(long_rri)
+
+        expected = np.cumsum(long_rri) / 1000
+        expected -= expected[0]
+        np.testing.assert_array_equal(rri_time, expected)
+
+    def test_create_time_array_long_series_compensated_sum(self):
+        pytest.importorskip("numba")
+        long_rri = np.random.RandomState(42).uniform(300, 1500, 100000) + 0.1
+        indexes = np.linspace(1, len(long_rri) - 1, 25).astype(int)
+
+        rri_time = _create_time_array(long_rri)
+
+        # Exact prefix sums. A plain cumulative sum is ~1e-9 off here
+        expected = [
+            (math.fsum(long_rri[: i + 1]) - long_rri[0]) / 1000 for i in indexes
+        ]
+        np.testing.assert_allclose(rri_time[indexes], expected, rtol=0, atol=1e-10)
+
     def test_rri_time_auto_creation(self):
         rri = RRi(FAKE_RRI)
         expected = np.cumsum(FAKE_RRI) / 1000
@@ -129,6 +152,34 @@ class TestRRiClassArguments:
         np.testing.assert_equal(rri_slice.values, expected.values)
         np.testing.assert_equal(rri_slice.time, expected.time)
 
+    def test__getitem__method_returns_read_only_view(self):
+        rri = RRi(FAKE_RRI)
+
+        rri_slice = rri[1:3]
+
+        assert np.shares_memory(rri_slice.values, rri.values)
+        assert np.shares_memory(rri_slice.time, rri.time)
+        with pytest.raises(ValueError):
+            rri_slice.values[0] = 1000
+        with pytest.raises(ValueError):
+            rri_slice.time[0] = 1
+
+    def test__getitem__method_with_stepped_slice_copies(self):
+        rri = RRi(FAKE_RRI)
+
+        rri_slice = rri[::2]
+
+        assert not np.shares_memory(rri_slice.values, rri.values)
+        np.testing.assert_equal(rri_slice.values, [800, 815])
+
+    def test__getitem__method_with_numpy_array_copies(self):
+        rri = RRi(FAKE_RRI)
+
+        rri_slice = rri[np.array([False, True, True, False])]
+
+        assert not np.shares_memory(rri_slice.values, rri.values)
+        assert not np.shares_memory(rri_slice.time, rri.time)
+
     def test__getitem_method_integer_position(self):
         # To not break the numpy API (i.e np.sum(rri)) when index is an
         # integer RRi __getitem__ method returns a numpy.float64
@@ -274,6 +325,69 @@ class TestRRiClassArguments:
         for result in results:
             assert isinstance(result, RRi)
 
+    def test_arithmetic_result_is_not_converted_to_miliseconds(self):
+        rri = RRi(FAKE_RRI)
+
+        result = rri / 1000
+
+        np.testing.assert_equal(result.values, np.array(FAKE_RRI) / 1000)
+        np.testing.assert_equal(result.time, rri.time)
+
+    def test_arithmetic_result_with_non_positive_values(self):
+        rri = RRi(FAKE_RRI)
+
+        with pytest.raises(ValueError):
+            rri - 800
+
+        with pytest.raises(ValueError):
+            rri * -1
+
+    def test_inplace_operation_on_ndarray_with_rri_instance(self):
+        values = np.ones(4)
+        buffer = values
+
+        values += RRi(FAKE_RRI)
+
+        assert type(values) is np.ndarray
+        assert values is buffer
+        np.testing.assert_equal(values, np.array(FAKE_RRI) + 1)
+
+        out = np.empty(4)
+        result = np.add(RRi(FAKE_RRI), 1, out=out)
+
+        assert result is out
+        np.testing.assert_equal(out, np.array(FAKE_RRI) + 1)
+
+    def test_rri_values_and_time_are_read_only(self):
+        rri = RRi(FAKE_RRI)
+
+        with pytest.raises(ValueError):
+            rri.values[0] = 1000
+
+        with pytest.raises(ValueError):
+            rri.time[0] = 1
+
+    def test_arithmetic_result_can_not_modify_original_time(self):
+        rri = RRi(FAKE_RRI)
+
+        result = rri * 2
+
+        with pytest.raises(ValueError):
+            result.time[1] = 99
+
+        np.testing.assert_equal(rri.time, _create_time_array(FAKE_RRI))
+
+    def test_inplace_operation_does_not_modify_rri_instance(self):
+        rri = RRi(FAKE_RRI)
+        original = rri
+
+        rri += 10
+
+        assert isinstance(rri, RRi)
+        assert rri is not original
+        np.testing.assert_equal(rri.values, [810, 820, 825, 760])
+        np.testing.assert_equal(original.values, FAKE_RRI)
+
 
 class TestRRiClassMethods:
     def test_rri_statistical_values(self):
@@ -377,6 +491,36 @@ class TestRRiClassMethods:
 
         np.testing.assert_array_almost_equal(heart_rate, expected)
 
+    def test_cached_heart_rate_can_not_become_stale(self):
+        rri = RRi(FAKE_RRI)
+        rri.to_hr()
+
+        with pytest.raises(ValueError):
+            rri.values[0] = 1000
+
+        np.testing.assert_array_almost_equal(rri.to_hr(), 60000.0 / np.array(FAKE_RRI))
+        np.testing.assert_almost_equal(rri.describe()["max"]["hr"], 80.0)
+
+    def test_rri_copy(self):
+        rri = RRi(FAKE_RRI, time=[4, 5, 6, 7])
+
+        rri_copy = rri.copy()
+
+        assert isinstance(rri_copy, RRi)
+        assert not np.shares_memory(rri_copy.values, rri.values)
+        assert not np.shares_memory(rri_copy.time, rri.time)
+        np.testing.assert_array_equal(rri_copy.values, rri.values)
+        np.testing.assert_array_equal(rri_copy.time, rri.time)
+
+    def test_rri_to_heart_rate_without_copy(self):
+        rri = RRi(FAKE_RRI)
+
+        heart_rate = rri.to_hr(copy=False)
+
+        assert heart_rate is rri.to_hr(copy=False)
+        assert not heart_rate.flags.writeable
+        np.testing.assert_array_equal(heart_rate, rri.to_hr())
+
     def test_get_rri_time_interval(self):
         rri = RRi(FAKE_RRI + [817, 785, 910], time=[2, 4, 6, 8, 10, 12, 14])
 
@@ -407,6 +551,16 @@ class TestRRiClassMethods:
         np.testing.assert_array_equal(rri.values, expected.values)
         np.testing.assert_array_equal(rri.time, expected.time)
 
+    def test_reset_time_can_not_modify_original_values(self):
+        rri = RRi(FAKE_RRI, time=[4, 5, 6, 7])
+
+        rri_reset = rri.reset_time()
+
+        with pytest.raises(ValueError):
+            rri_reset.values[0] = 1
+
+        np.testing.assert_array_equal(rri.values, FAKE_RRI)
+
     def test_calculate_mean_with_numpy_function(self):
         rri = RRi(FAKE_RRI, time=[4, 5, 6, 7])
 
@@ -556,6 +710,24 @@ class TestRRiDetrended:
         assert det_rri_obj.detrended
         assert not det_rri_obj.interpolated
 
+    def test_segments_of_detrended_rri_keep_class_and_flags(self):
+        detrended_rri = [-87.98, -88.22, -49.46, -109.69, -181.90]
+        rri_time = [0, 1, 2, 3, 4]
+        det_rri_obj = RRiDetrended(detrended_rri, time=rri_time, interpolated=True)
+
+        segments = (
+            det_rri_obj[1:3],
+            det_rri_obj[np.array([True, False, True, False, True])],
+            det_rri_obj.time_range(start=1, end=3),
+            det_rri_obj.reset_time(),
+            det_rri_obj.copy(),
+        ) + tuple(det_rri_obj.time_split(seg_size=2))
+
+        for segment in segments:
+            assert isinstance(segment, RRiDetrended)
+            assert segment.detrended
+            assert segment.interpolated
+
 
 class TestSegmentsMixin:
     def assert_splitted_equal(self, left, right):
@@ -583,3 +755,14 @@ class TestSplitRRi(TestSegmentsMixin):
         ]
 
         self.assert_splitted_equal(splitted_rri, expected)
+
+    def test_split_rri_segments_are_read_only_views(self):
+        rri = RRi([800, 810, 790, 795, 801], time=[1, 4.9, 5.1, 9.9, 12])
+
+        splitted_rri = rri.time_split(seg_size=5, overlap=0, keep_last=True)
+
+        for segment in splitted_rri:
+            assert np.shares_memory(segment.values, rri.values)
+            assert np.shares_memory(segment.time, rri.time)
+            with pytest.raises(ValueError):
+                segment.values[0] = 1000